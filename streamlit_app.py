@@ -25,9 +25,13 @@
 #
 #**********************************************
 
+from collections import namedtuple
+
+import numpy as np
 import streamlit as st
 import pandas as pd
-import plotly.express as px
+import plotly.graph_objects as go
+from numba import njit
 
 # IMPORTANT: set_page_config must be the very first Streamlit command
 st.set_page_config(page_title="Interactive FIFA Data Dashboard", layout="wide")
@@ -39,7 +43,7 @@ st.set_page_config(page_title="Interactive FIFA Data Dashboard", layout="wide")
 #  - Adjust the title's style (larger font and negative top margin)
 #  - Pin the footer to the bottom
 # -----------------------------------------------------------------------------
-st.markdown("""
+_CSS = """
     <style>
     /* Import the Roboto font from Google Fonts */
     @import url('https://fonts.googleapis.com/css2?family=Roboto:wght@400;700&display=swap');
@@ -86,7 +90,15 @@ st.markdown("""
         z-index: 9999; /* Ensure footer stays on top */
     }
     </style>
-""", unsafe_allow_html=True)
+"""
+
+@st.cache_resource
+def _inject_css():
+    # The style block never changes, so intern it once per server process;
+    # reruns replay the cached markdown element instead of rebuilding it.
+    st.markdown(_CSS, unsafe_allow_html=True)
+
+_inject_css()
 
 # -----------------------------------------------------------------------------
 # Custom Title
@@ -96,12 +108,117 @@ st.markdown('<h1 class="big-title">⚽ Interactive FIFA Data Dashboard ⚽</h1>'
 # -----------------------------------------------------------------------------
 # Data Loading
 # -----------------------------------------------------------------------------
+# The loader also precomputes the column summaries the sidebar needs (slider
+# bounds and the sorted nationality list) so they are cached alongside the
+# data instead of being recomputed on every rerun. Nationality is stored as a
+# pandas Categorical: the filter below can then compare small integer codes
+# rather than hashing Python strings.
+FifaData = namedtuple("FifaData", ["df", "age_min", "age_max", "overall_min", "overall_max", "nationalities"])
+
 @st.cache_data
 def load_data():
-    df = pd.read_csv("FIFA DATA.csv")
-    return df
+    # The Parquet copy is generated once from the CSV with
+    # pd.read_csv("FIFA DATA.csv").to_parquet("FIFA DATA.parquet", compression='zstd')
+    # and loads far faster than re-tokenising the CSV on every cold start.
+    # Listing only the columns the dashboard uses lets pyarrow skip reading
+    # the rest of the file entirely.
+    df = pd.read_parquet(
+        "FIFA DATA.parquet",
+        engine='pyarrow',
+        columns=['Name', 'Age', 'Nationality', 'OverallRating', 'Club', 'Value '],
+    )
+    # The source data carries a trailing space in the Value header; strip it
+    # here so the rest of the app stops depending on the fragile literal.
+    df = df.rename(columns={'Value ': 'Value'})
+    # Narrow the dtypes: ages and ratings both fit comfortably in small
+    # integers, and the string columns become categoricals so every
+    # downstream filter and groupby works on compact integer codes.
+    df['Age'] = df['Age'].astype('int8')
+    df['OverallRating'] = df['OverallRating'].astype('int16')
+    for col in ['Nationality', 'Club', 'Name']:
+        df[col] = df[col].astype('category')
+    # Sort by Club once at load: boolean-mask filtering preserves the order,
+    # so every club aggregation downstream scans contiguous runs of codes
+    # instead of jumping around the ratings buffer.
+    df = df.sort_values('Club', kind='stable').reset_index(drop=True)
+    return FifaData(
+        df=df,
+        age_min=int(df['Age'].min()),
+        age_max=int(df['Age'].max()),
+        overall_min=int(df['OverallRating'].min()),
+        overall_max=int(df['OverallRating'].max()),
+        nationalities=df['Nationality'].cat.categories.tolist(),
+    )
+
+data = load_data()
+df = data.df
+
+# -----------------------------------------------------------------------------
+# Cached Filtering and Aggregation
+# -----------------------------------------------------------------------------
+# Each step is cached on the filter settings that actually affect it, so e.g.
+# dragging the histogram bin slider re-bins from the cached filtered frame
+# without re-running the filter or the club groupby.
+@njit(cache=True, boundscheck=False)
+def _build_mask(age, overall, nat_codes, a0, a1, o0, o1, allowed):
+    # One fused pass writing a single boolean output, instead of one
+    # temporary array per comparison. `allowed` is a boolean lookup table
+    # indexed by nationality code, so the membership test is O(1) per row.
+    n = age.shape[0]
+    out = np.empty(n, np.bool_)
+    for i in range(n):
+        out[i] = (a0 <= age[i] <= a1) and (o0 <= overall[i] <= o1) and allowed[nat_codes[i]]
+    return out
 
-df = load_data()
+@st.cache_data
+def get_filtered(age_range, overall_range, nationalities):
+    # The default state of every control selects everything, so the common
+    # path skips the mask entirely. Anything else goes through the JIT'd
+    # kernel, which compares int8 nationality codes instead of hashing
+    # strings. Slider drags trigger rapid reruns, so cache=True persists
+    # the compiled kernel across server restarts.
+    all_ranges_default = (
+        age_range == (data.age_min, data.age_max)
+        and overall_range == (data.overall_min, data.overall_max)
+    )
+    if all_ranges_default and len(nationalities) == len(data.nationalities):
+        return df
+    allowed = np.zeros(len(data.nationalities), np.bool_)
+    allowed[df['Nationality'].cat.categories.get_indexer(list(nationalities))] = True
+    mask = _build_mask(
+        df['Age'].to_numpy(copy=False),
+        df['OverallRating'].to_numpy(copy=False),
+        df['Nationality'].cat.codes.to_numpy(copy=False),
+        age_range[0], age_range[1],
+        overall_range[0], overall_range[1],
+        allowed,
+    )
+    return df[mask]
+
+@st.cache_data
+def get_club_top10(age_range, overall_range, nationalities):
+    # Compute the per-club means directly on the categorical codes with two
+    # np.bincount passes instead of walking the pandas groupby hash path,
+    # then pick the top 10 with argpartition (O(N)) rather than a full sort.
+    fdf = get_filtered(age_range, overall_range, nationalities)
+    cats = fdf['Club'].cat.categories
+    codes = fdf['Club'].cat.codes.to_numpy()
+    ratings = fdf['OverallRating'].to_numpy(dtype=np.float64)
+    sums = np.bincount(codes, weights=ratings, minlength=len(cats))
+    counts = np.bincount(codes, minlength=len(cats))
+    means = np.full(len(cats), -np.inf)
+    np.divide(sums, counts, out=means, where=counts > 0)
+    k = min(10, int(np.count_nonzero(counts)))
+    if k == 0:
+        return pd.DataFrame({'Club': [], 'OverallRating': []})
+    top_idx = np.argpartition(-means, k - 1)[:k]
+    top_idx = top_idx[np.argsort(-means[top_idx])]
+    return pd.DataFrame({'Club': cats[top_idx], 'OverallRating': means[top_idx]})
+
+@st.cache_data
+def get_histogram(age_range, overall_range, nationalities, bins):
+    ratings = get_filtered(age_range, overall_range, nationalities)['OverallRating'].to_numpy(copy=False)
+    return np.histogram(ratings, bins=bins)
 
 # -----------------------------------------------------------------------------
 # Sidebar for Interactive Filters
@@ -109,83 +226,171 @@ df = load_data()
 st.sidebar.header("Filter Options")
 
 # Filter: Age Range
-age_min, age_max = int(df['Age'].min()), int(df['Age'].max())
-age_range = st.sidebar.slider("Select Age Range", age_min, age_max, (age_min, age_max))
+age_range = st.sidebar.slider("Select Age Range", data.age_min, data.age_max, (data.age_min, data.age_max))
 
 # Filter: Overall Rating Range
-overall_min, overall_max = int(df['OverallRating'].min()), int(df['OverallRating'].max())
-overall_range = st.sidebar.slider("Select Overall Rating Range", overall_min, overall_max, (overall_min, overall_max))
+overall_range = st.sidebar.slider("Select Overall Rating Range", data.overall_min, data.overall_max, (data.overall_min, data.overall_max))
 
 # Filter: Nationality
-nationality_options = sorted(df['Nationality'].unique())
+nationality_options = data.nationalities
 selected_nationalities = st.sidebar.multiselect("Select Nationalities", nationality_options, default=nationality_options)
 
 # Apply Filters
-filtered_df = df[
-    (df['Age'] >= age_range[0]) & (df['Age'] <= age_range[1]) &
-    (df['OverallRating'] >= overall_range[0]) & (df['OverallRating'] <= overall_range[1]) &
-    (df['Nationality'].isin(selected_nationalities))
-]
+# The nationality tuple is sorted so reorderings of the same selection hit
+# the same cache entry.
+nationality_key = tuple(sorted(selected_nationalities))
+filtered_df = get_filtered(age_range, overall_range, nationality_key)
 
 st.sidebar.markdown(f"**Filtered Players:** {filtered_df.shape[0]}")
 
 # Option to Show Raw Filtered Data
 if st.sidebar.checkbox("Show raw data"):
     st.subheader("Raw Data")
-    st.dataframe(filtered_df)
-
-# Additional Interactive Options for the Plots
-bins = st.sidebar.slider("Number of bins for histogram", 10, 50, 20)
-bubble_scale = st.sidebar.slider("Bubble size scale factor", 10, 100, 30)
+    # Project to the displayed columns and cap the rows sent over Arrow:
+    # the grid only shows a screenful at a time, so serialising thousands
+    # of rows per rerun buys nothing. The Parquet-loaded columns are
+    # already Arrow-backed, making the slice cheap to ship.
+    st.dataframe(
+        filtered_df[['Name', 'Age', 'OverallRating', 'Nationality', 'Club', 'Value']].head(1000),
+        use_container_width=True,
+        height=400,
+    )
 
 # -----------------------------------------------------------------------------
 # Layout: Display Plots in Two Columns
 # -----------------------------------------------------------------------------
-col1, col2 = st.columns(2)
+# Each chart is an st.fragment with its own controls, so e.g. dragging the
+# bin slider reruns only the histogram fragment instead of rebuilding all
+# three figures.
+#
+# Figures with a fixed layout are built once per session and only have their
+# data arrays swapped on rerun; together with a stable st.plotly_chart key,
+# the frontend patches the existing plotly div instead of tearing it down
+# and re-parsing the full layout JSON.
 
-with col1:
+def _figure_scaffold(state_key, make):
+    if state_key not in st.session_state:
+        st.session_state[state_key] = make()
+    return st.session_state[state_key]
+
+# Session-local cache for aggregate results, layered in front of
+# @st.cache_data's global store: a user oscillating the sliders back to a
+# recently visited combination gets the result straight out of their own
+# session without re-hashing the cache_data arguments. Insertion order
+# doubles as the eviction order.
+_SESSION_CACHE_SIZE = 32
+
+def _session_cached(cache_name, key, compute):
+    cache = st.session_state.setdefault(cache_name, {})
+    if key in cache:
+        return cache[key]
+    result = compute()
+    cache[key] = result
+    if len(cache) > _SESSION_CACHE_SIZE:
+        cache.pop(next(iter(cache)))
+    return result
+
+@st.fragment
+def render_histogram(age_range, overall_range, nationality_key):
     st.subheader("Distribution of Player Overall Ratings")
-    fig1 = px.histogram(
-        filtered_df,
-        x='OverallRating',
-        nbins=bins,
-        title="Distribution of Player Overall Ratings",
-        labels={"OverallRating": "Overall Rating", "count": "Number of Players"}
-    )
-    fig1.update_layout(bargap=0.1)
-    st.plotly_chart(fig1, use_container_width=True)
+    bins = st.slider("Number of bins for histogram", 10, 50, 20)
+    # Bin server-side with np.histogram so the browser receives `bins`
+    # bar heights instead of the whole raw column, and plotly.js skips
+    # its own binning pass.
+    counts, edges = get_histogram(age_range, overall_range, nationality_key, bins)
+    fig1 = _figure_scaffold('hist_fig', lambda: go.Figure(
+        go.Bar(x=[], y=[]),
+        layout=dict(
+            bargap=0.1,
+            title="Distribution of Player Overall Ratings",
+            xaxis_title="Overall Rating",
+            yaxis_title="Number of Players",
+        ),
+    ))
+    bar = fig1.data[0]
+    bar.x = (edges[:-1] + edges[1:]) / 2
+    bar.y = counts
+    bar.width = edges[1] - edges[0]
+    st.plotly_chart(fig1, use_container_width=True, key='hist_chart')
 
-with col2:
+@st.fragment
+def render_scatter(age_range, overall_range, nationality_key):
     st.subheader("Player Age vs Overall Rating")
-    fig2 = px.scatter(
-        filtered_df,
-        x='Age',
-        y='OverallRating',
-        size='Value ',          # Ensure the column name matches exactly
-        color='Nationality',
-        hover_name='Name',
-        title="Player Age vs Overall Rating (Bubble size represents Value)",
-        size_max=bubble_scale
+    bubble_scale = st.slider("Bubble size scale factor", 10, 100, 30)
+    scatter_sample = st.slider("Scatter sample size", 500, 5000, 2000, step=500)
+    filtered_df = get_filtered(age_range, overall_range, nationality_key)
+    # Cap the number of points sent to the browser: plotly's per-point work
+    # scales linearly, and beyond a couple of thousand markers a uniform
+    # random sample looks identical. The fixed seed keeps reruns stable.
+    if len(filtered_df) > scatter_sample:
+        scatter_df = filtered_df.sample(scatter_sample, random_state=0)
+    else:
+        scatter_df = filtered_df
+    # A single go.Scattergl trace coloured by integer nationality codes:
+    # the payload ships one int8 per point instead of a nationality string,
+    # and names travel once via customdata for the hover label. With one
+    # trace the figure can also use the shared scaffold.
+    fig2 = _figure_scaffold('scatter_fig', lambda: go.Figure(
+        go.Scattergl(
+            x=[], y=[], mode='markers',
+            marker=dict(colorscale='Viridis', line_width=0, sizemode='diameter'),
+            hovertemplate='%{customdata}<br>Age %{x}<br>Overall Rating %{y}<extra></extra>',
+        ),
+        layout=dict(
+            title="Player Age vs Overall Rating (Bubble size represents Value)",
+            xaxis_title="Age",
+            yaxis_title="Overall Rating",
+        ),
+    ))
+    trace = fig2.data[0]
+    # copy=False hands the trace a view of the column buffer where possible,
+    # skipping both the copy and pandas' per-column schema inference that
+    # the express wrappers would run.
+    trace.x = scatter_df['Age'].to_numpy(copy=False)
+    trace.y = scatter_df['OverallRating'].to_numpy(copy=False)
+    trace.customdata = scatter_df['Name'].to_numpy()
+    trace.marker.color = scatter_df['Nationality'].cat.codes.to_numpy()
+    # Pre-normalise bubble diameters in numpy (area proportional to Value)
+    # so plotly.js receives ready-to-use pixel sizes instead of running its
+    # own scaling pass over the raw values.
+    values = scatter_df['Value'].to_numpy(dtype=np.float32)
+    max_value = values.max() if len(values) else 1.0
+    trace.marker.size = np.sqrt(values / max(max_value, 1.0)) * bubble_scale
+    st.plotly_chart(fig2, use_container_width=True, key='scatter_chart')
+
+@st.fragment
+def render_clubs(age_range, overall_range, nationality_key):
+    st.subheader("Top 10 Clubs by Average Overall Rating")
+    club_avg = _session_cached(
+        'club_cache',
+        (age_range, overall_range, frozenset(nationality_key)),
+        lambda: get_club_top10(age_range, overall_range, nationality_key),
     )
-    fig2.update_layout(xaxis_title="Age", yaxis_title="Overall Rating")
-    st.plotly_chart(fig2, use_container_width=True)
+    fig3 = _figure_scaffold('clubs_fig', lambda: go.Figure(
+        go.Bar(x=[], y=[]),
+        layout=dict(
+            title="Top 10 Clubs by Average Overall Rating",
+            xaxis=dict(title="Club", tickangle=-45),
+            yaxis_title="Average Overall Rating",
+        ),
+    ))
+    bar = fig3.data[0]
+    bar.x = club_avg['Club'].to_numpy()
+    bar.y = club_avg['OverallRating'].to_numpy(copy=False)
+    st.plotly_chart(fig3, use_container_width=True, key='clubs_chart')
+
+col1, col2 = st.columns(2)
+
+with col1:
+    render_histogram(age_range, overall_range, nationality_key)
+
+with col2:
+    render_scatter(age_range, overall_range, nationality_key)
 
 # -----------------------------------------------------------------------------
 # Bar Chart: Top 10 Clubs by Average Overall Rating
 # -----------------------------------------------------------------------------
-st.subheader("Top 10 Clubs by Average Overall Rating")
-club_avg = filtered_df.groupby('Club', as_index=False)['OverallRating'].mean()
-club_avg = club_avg.sort_values(by='OverallRating', ascending=False).head(10)
-
-fig3 = px.bar(
-    club_avg,
-    x='Club',
-    y='OverallRating',
-    title="Top 10 Clubs by Average Overall Rating",
-    labels={"OverallRating": "Average Overall Rating", "Club": "Club"}
-)
-fig3.update_layout(xaxis_tickangle=-45)
-st.plotly_chart(fig3, use_container_width=True)
+render_clubs(age_range, overall_range, nationality_key)
 
 # -----------------------------------------------------------------------------
 # Footer Section